@@ -102,8 +102,8 @@ def main():
         # Generate HTML report
         print(f"\n📄 Generating HTML report...")
         from src.visualization.report_generator import ReportGenerator
-        report_gen = ReportGenerator()
-        html_path = report_gen.generate_html_report(results, service, source)
+        with ReportGenerator() as report_gen:
+            html_path = report_gen.generate_html_report(results, service, source)
         print(f"   HTML report: {html_path}")
         
         print("\n" + "=" * 60)
@@ -12,7 +12,7 @@ from colorama import init, Fore, Style
 from tqdm import tqdm
 
 from .config import AVAILABLE_SOURCES, DEFAULT_SOURCE, AnalysisConfig
-from .utils.logger import get_logger, app_logger
+from .utils.logger import get_logger, set_level
 from .utils.data_validator import validate_cli_args
 from .utils.file_manager import FileManager
 
@@ -111,11 +111,11 @@ def main(service: str, source: str, days: int, max_posts: int, output_dir: Optio
     
     # Setup logging based on verbosity
     if quiet:
-        app_logger.logger.setLevel('ERROR')
+        set_level('ERROR')
     elif verbose:
-        app_logger.logger.setLevel('DEBUG')
+        set_level('DEBUG')
     else:
-        app_logger.logger.setLevel('INFO')
+        set_level('INFO')
     
     # Print banner
     if not quiet:
@@ -301,8 +301,8 @@ def run_analysis(service: str, source: str, days: int, max_posts: int,
             
             if format in ['html', 'all']:
                 from .visualization.report_generator import ReportGenerator
-                report_gen = ReportGenerator()
-                html_path = report_gen.generate_html_report(results, service, source)
+                with ReportGenerator() as report_gen:
+                    html_path = report_gen.generate_html_report(results, service, source)
                 if html_path and not quiet:
                     click.echo(ColoredFormatter.colorize(f"   HTML report: {html_path}", 'success'))
         
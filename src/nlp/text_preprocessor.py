@@ -2,6 +2,7 @@
 Text preprocessing utilities for NLP analysis.
 Handles cleaning, normalization, and language detection.
 """
+import importlib.util
 import re
 import string
 from typing import List, Dict, Any, Optional
@@ -12,21 +13,26 @@ from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from nltk.stem import SnowballStemmer
 
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+# spaCy is only imported when the stopword fallback actually needs it
+SPACY_AVAILABLE = importlib.util.find_spec('spacy') is not None
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Download required NLTK data
+# Download required NLTK data (skipped when already cached locally)
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'punkt_tab': 'tokenizers/punkt_tab',
+}
+
 try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
+    for package, resource_path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(resource_path)
+        except LookupError:
+            nltk.download(package, quiet=True)
 except Exception as e:
     logger.warning(f"Could not download NLTK data: {e}")
 
@@ -205,6 +211,7 @@ class TextPreprocessor:
         if not stopwords_set and SPACY_AVAILABLE:
             # Fallback to spaCy stopwords
             try:
+                import spacy
                 nlp = spacy.load('fr_core_news_sm' if language == 'french' else 'en_core_web_sm')
                 stopwords_set = nlp.Defaults.stop_words
             except Exception:
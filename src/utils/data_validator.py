@@ -3,12 +3,28 @@ Data validation utilities for the social media sentiment analysis application.
 Provides validation for inputs, API responses, and processed data.
 """
 import re
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union
 from urllib.parse import urlparse
 
 from ..config import AnalysisConfig, AVAILABLE_SOURCES
 
+# ISO 8601 timestamp shape, checked without building a datetime
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+\-]\d{2}:?\d{2})?$')
+
+# Basic validation - allow alphanumeric, spaces, and common punctuation
+_SERVICE_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-_.,&\'()]+$')
+
+# Service/source values repeat across records, so results are memoized
+@lru_cache(maxsize=256)
+def _validate_service_name(service: str) -> bool:
+    return bool(_SERVICE_NAME_RE.match(service)) and len(service) <= 100
+
+@lru_cache(maxsize=64)
+def _validate_source(source: str) -> bool:
+    return source.lower() in AVAILABLE_SOURCES
+
 class DataValidator:
     """Data validation utilities"""
     
@@ -18,14 +34,12 @@ class DataValidator:
         if not service or not isinstance(service, str):
             return False
         
-        # Basic validation - allow alphanumeric, spaces, and common punctuation
-        pattern = r'^[a-zA-Z0-9\s\-_.,&\'()]+$'
-        return bool(re.match(pattern, service)) and len(service) <= 100
+        return _validate_service_name(service)
     
     @staticmethod
     def validate_source(source: str) -> bool:
         """Validate data source"""
-        return source.lower() in AVAILABLE_SOURCES
+        return _validate_source(source)
     
     @staticmethod
     def validate_days(days: int) -> bool:
@@ -59,16 +73,20 @@ class DataValidator:
         if not text or not isinstance(text, str):
             return False
         
-        # Check minimum length
-        if len(text.strip()) < 10:
+        # Check length bounds on the raw text first (no allocation)
+        length = len(text)
+        if length < 10 or length > 5000:
             return False
         
-        # Check for excessive length
-        if len(text) > 5000:
+        # Basic content validation
+        if text.isspace():
             return False
         
-        # Basic content validation
-        return not text.isspace()
+        # Only strip when surrounding whitespace can push it under the minimum
+        if text[0].isspace() or text[-1].isspace():
+            return len(text.strip()) >= 10
+        
+        return True
     
     @staticmethod
     def validate_url(url: str) -> bool:
@@ -97,9 +115,8 @@ class DataValidator:
             return False
         
         # Validate date format
-        try:
-            datetime.fromisoformat(tweet_data['created_at'].replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
+        created_at = tweet_data['created_at']
+        if not isinstance(created_at, str) or not _ISO_RE.match(created_at):
             return False
         
         return True
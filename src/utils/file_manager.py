@@ -4,18 +4,30 @@ Handles file operations, CSV exports, and data persistence.
 """
 import csv
 import json
+import os
 import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 from ..config import OUTPUTS_DIR, CSV_SETTINGS
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Trailing _YYYYMMDD_HHMMSS stamp appended by create_timestamped_folder
+_FOLDER_TIMESTAMP_RE = re.compile(r'_(\d{8})_(\d{6})$')
+
+def _folder_timestamp(name: str) -> int:
+    """Numeric sort key from a timestamped folder name (0 if absent)"""
+    match = _FOLDER_TIMESTAMP_RE.search(name)
+    return int(match.group(1) + match.group(2)) if match else 0
+
 class FileManager:
     """File operations manager"""
     
@@ -48,6 +60,7 @@ class FileManager:
                 return filepath
             
             # Convert to DataFrame for better CSV handling
+            import pandas as pd
             df = pd.DataFrame(data)
             
             # Ensure output directory exists
@@ -86,37 +99,49 @@ class FileManager:
             # Create timestamped folder
             output_dir = self.create_timestamped_folder(service, source)
             
-            # Save raw data
-            if 'raw_data' in analysis_results:
-                self.save_to_csv(
-                    analysis_results['raw_data'], 
-                    'raw_data', 
-                    output_dir
-                )
-            
-            # Save processed data with sentiment
-            if 'processed_data' in analysis_results:
-                self.save_to_csv(
-                    analysis_results['processed_data'],
-                    'processed_data',
-                    output_dir
-                )
-            
-            # Save sentiment summary
-            if 'sentiment_summary' in analysis_results:
-                self.save_json(
-                    analysis_results['sentiment_summary'],
-                    'sentiment_summary',
-                    output_dir
-                )
-            
-            # Save keywords data
-            if 'keywords_data' in analysis_results:
-                self.save_to_csv(
-                    analysis_results['keywords_data'],
-                    'keywords',
-                    output_dir
-                )
+            # Data files are independent, so write them concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = []
+                
+                # Save raw data
+                if 'raw_data' in analysis_results:
+                    futures.append(executor.submit(
+                        self.save_to_csv,
+                        analysis_results['raw_data'], 
+                        'raw_data', 
+                        output_dir
+                    ))
+                
+                # Save processed data with sentiment
+                if 'processed_data' in analysis_results:
+                    futures.append(executor.submit(
+                        self.save_to_csv,
+                        analysis_results['processed_data'],
+                        'processed_data',
+                        output_dir
+                    ))
+                
+                # Save sentiment summary
+                if 'sentiment_summary' in analysis_results:
+                    futures.append(executor.submit(
+                        self.save_json,
+                        analysis_results['sentiment_summary'],
+                        'sentiment_summary',
+                        output_dir
+                    ))
+                
+                # Save keywords data
+                if 'keywords_data' in analysis_results:
+                    futures.append(executor.submit(
+                        self.save_to_csv,
+                        analysis_results['keywords_data'],
+                        'keywords',
+                        output_dir
+                    ))
+                
+                # Propagate the first write error, as the sequential version did
+                for future in futures:
+                    future.result()
             
             # Save complete report metadata
             report_metadata = {
@@ -142,9 +167,10 @@ class FileManager:
             logger.error(f"Error saving analysis report: {str(e)}")
             raise
     
-    def load_csv(self, filepath: Path) -> pd.DataFrame:
+    def load_csv(self, filepath: Path) -> 'pd.DataFrame':
         """Load data from CSV file"""
         try:
+            import pandas as pd
             return pd.read_csv(filepath, encoding='utf-8-sig')
         except Exception as e:
             logger.error(f"Error loading CSV file {filepath}: {str(e)}")
@@ -162,14 +188,19 @@ class FileManager:
     def get_latest_analysis_folder(self, service: str, source: str) -> Optional[Path]:
         """Get the latest analysis folder for a service/source combination"""
         try:
-            pattern = f"{service}_{source}_*"
-            matching_folders = list(self.base_output_dir.glob(pattern))
-            
-            if not matching_folders:
+            prefix = f"{service}_{source}_"
+            with os.scandir(self.base_output_dir) as it:
+                matching_names = [
+                    entry.name for entry in it
+                    if entry.name.startswith(prefix) and entry.is_dir()
+                ]
+            
+            if not matching_names:
                 return None
             
             # Sort by timestamp (folder name contains timestamp)
-            return max(matching_folders, key=lambda x: x.name)
+            latest = max(matching_names, key=lambda name: (_folder_timestamp(name), name))
+            return self.base_output_dir / latest
             
         except Exception as e:
             logger.error(f"Error finding latest analysis folder: {str(e)}")
@@ -178,15 +209,19 @@ class FileManager:
     def cleanup_old_files(self, days_to_keep: int = 30):
         """Clean up old analysis files"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            
-            for folder in self.base_output_dir.iterdir():
-                if folder.is_dir():
-                    folder_date = datetime.fromtimestamp(folder.stat().st_mtime)
-                    if folder_date < cutoff_date:
-                        import shutil
-                        shutil.rmtree(folder)
-                        logger.info(f"Removed old folder: {folder.name}")
+            cutoff = (datetime.now() - timedelta(days=days_to_keep)).timestamp()
+            
+            with os.scandir(self.base_output_dir) as it:
+                old_folders = [
+                    entry.path for entry in it
+                    if entry.is_dir(follow_symlinks=False)
+                    and entry.stat(follow_symlinks=False).st_mtime < cutoff
+                ]
+            
+            for folder in old_folders:
+                import shutil
+                shutil.rmtree(folder)
+                logger.info(f"Removed old folder: {os.path.basename(folder)}")
                         
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
\ No newline at end of file
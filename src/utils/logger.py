@@ -2,77 +2,133 @@
 Logging utility for the social media sentiment analysis application.
 Provides structured logging with rotation and multiple handlers.
 """
+import atexit
 import logging
 import logging.handlers
+import multiprocessing
+import queue
 import sys
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..config import LoggingConfig, OUTPUTS_DIR
 
-class Logger:
-    """Custom logger with file and console handlers"""
-    
-    def __init__(self, name: str, log_file: Optional[Path] = None):
-        self.name = name
-        self.log_file = log_file or LoggingConfig.LOG_FILE
-        self.logger = self._setup_logger()
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Setup logger with handlers"""
-        logger = logging.getLogger(self.name)
+_CONFIGURED = False
+
+# Our own top-level loggers; the root logger is left alone so third-party
+# libraries (matplotlib, urllib3, ...) keep their default behaviour
+_TOP_LEVEL_LOGGERS = (__name__.split('.')[0], 'app')
+
+# File records are queued here and written to disk by a background listener
+_LOG_QUEUE = queue.Queue(-1)
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+# Records from worker processes arrive here and are re-dispatched in this process
+_WORKER_CONTEXT: Optional[BaseContext] = None
+_WORKER_QUEUE = None
+_WORKER_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+class _ParentDispatchHandler(logging.Handler):
+    """Hand a worker's record to the same-named logger in this process"""
+
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger(record.name).handle(record)
+
+def _configure_loggers(log_file: Optional[Path] = None):
+    """Attach console and rotating file handlers to our top-level loggers once"""
+    global _CONFIGURED, _LISTENER
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+
+    # Worker processes log through the parent (see init_worker_logging)
+    if multiprocessing.parent_process() is not None:
+        return
+
+    log_file = log_file or LoggingConfig.LOG_FILE
+    handlers = []
+
+    # Create formatters
+    formatter = logging.Formatter(LoggingConfig.LOG_FORMAT)
+
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
+
+    # File handler with rotation
+    file_error = None
+    try:
+        # Ensure output directory exists
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=LoggingConfig.LOG_MAX_BYTES,
+            backupCount=LoggingConfig.LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+
+        _LISTENER = logging.handlers.QueueListener(
+            _LOG_QUEUE, file_handler, respect_handler_level=True
+        )
+        _LISTENER.start()
+        atexit.register(_LISTENER.stop)
+
+        handlers.append(logging.handlers.QueueHandler(_LOG_QUEUE))
+    except Exception as e:
+        file_error = e
+
+    for name in _TOP_LEVEL_LOGGERS:
+        logger = logging.getLogger(name)
         logger.setLevel(getattr(logging, LoggingConfig.LOG_LEVEL))
-        
-        # Avoid duplicate handlers
-        if logger.handlers:
-            return logger
-        
-        # Create formatters
-        formatter = logging.Formatter(LoggingConfig.LOG_FORMAT)
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        
-        # File handler with rotation
-        try:
-            # Ensure output directory exists
-            self.log_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.handlers.RotatingFileHandler(
-                self.log_file,
-                maxBytes=LoggingConfig.LOG_MAX_BYTES,
-                backupCount=LoggingConfig.LOG_BACKUP_COUNT,
-                encoding='utf-8'
-            )
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-        except Exception as e:
-            logger.warning(f"Could not setup file handler: {e}")
-        
-        return logger
-    
-    def debug(self, message: str, **kwargs):
-        self.logger.debug(message, **kwargs)
-    
-    def info(self, message: str, **kwargs):
-        self.logger.info(message, **kwargs)
-    
-    def warning(self, message: str, **kwargs):
-        self.logger.warning(message, **kwargs)
-    
-    def error(self, message: str, **kwargs):
-        self.logger.error(message, **kwargs)
-    
-    def exception(self, message: str, **kwargs):
-        self.logger.exception(message, **kwargs)
-
-def get_logger(name: str) -> Logger:
+        for handler in handlers:
+            logger.addHandler(handler)
+        # Handled here; don't also pass records to handlers on the root logger
+        logger.propagate = False
+
+    if file_error is not None:
+        logging.getLogger(__name__).warning(f"Could not setup file handler: {file_error}")
+
+def set_level(level: str):
+    """Set the log level of all application loggers (e.g. 'DEBUG', 'ERROR')"""
+    _configure_loggers()
+    for name in _TOP_LEVEL_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+
+def get_worker_logging() -> Tuple[BaseContext, 'multiprocessing.Queue', int]:
+    """Process context, record queue and level for worker pools that log through this process"""
+    global _WORKER_CONTEXT, _WORKER_QUEUE, _WORKER_LISTENER
+    _configure_loggers()
+    if _WORKER_QUEUE is None:
+        # Never fork: this process runs listener threads whose locks a forked child would inherit
+        methods = multiprocessing.get_all_start_methods()
+        _WORKER_CONTEXT = multiprocessing.get_context(
+            'forkserver' if 'forkserver' in methods else 'spawn'
+        )
+        _WORKER_QUEUE = _WORKER_CONTEXT.Queue(-1)
+        _WORKER_LISTENER = logging.handlers.QueueListener(_WORKER_QUEUE, _ParentDispatchHandler())
+        _WORKER_LISTENER.start()
+        atexit.register(_WORKER_LISTENER.stop)
+    return _WORKER_CONTEXT, _WORKER_QUEUE, logging.getLogger(_TOP_LEVEL_LOGGERS[0]).level
+
+def init_worker_logging(log_queue, level: int):
+    """Pool initializer helper: send this worker's records to the parent's queue"""
+    handler = logging.handlers.QueueHandler(log_queue)
+    for name in _TOP_LEVEL_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        logger.handlers[:] = [handler]
+        logger.propagate = False
+
+def get_logger(name: str) -> logging.Logger:
     """Get a configured logger instance"""
-    return Logger(name)
+    _configure_loggers()
+    return logging.getLogger(name)
 
 # Global logger instance
-app_logger = get_logger("app")
\ No newline at end of file
+app_logger = get_logger("app")
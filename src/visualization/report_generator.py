@@ -3,187 +3,99 @@ Report generator for sentiment analysis results.
 Creates comprehensive HTML and PDF reports with all analysis results.
 """
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-import base64
+from typing import Dict, Any, Iterator, List, Optional, TYPE_CHECKING
+import binascii
 import io
+from html import escape
+from string import Template
 
 try:
-    from matplotlib import pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 from ..config import OUTPUTS_DIR
-from ..utils.logger import get_logger
-from .charts_generator import ChartsGenerator
-from .wordcloud_generator import WordCloudGenerator
+from ..utils.logger import get_logger, get_worker_logging, init_worker_logging
+
+if TYPE_CHECKING:
+    from .charts_generator import ChartsGenerator
+    from .wordcloud_generator import WordCloudGenerator
 
 logger = get_logger(__name__)
 
-class ReportGenerator:
-    """Generate comprehensive analysis reports"""
-    
-    def __init__(self):
-        self.charts_generator = ChartsGenerator()
-        self.wordcloud_generator = WordCloudGenerator()
-    
-    def generate_html_report(self, analysis_results: Dict[str, Any], 
-                           service: str, source: str,
-                           save_path: Optional[str] = None) -> str:
-        """Generate comprehensive HTML report"""
-        try:
-            # Generate charts and word clouds
-            charts_data = self._generate_charts_data(analysis_results)
-            
-            # Build HTML content
-            html_content = self._build_html_report(
-                analysis_results, service, source, charts_data
-            )
-            
-            # Save HTML file
-            if save_path:
-                with open(save_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                logger.info(f"HTML report saved to {save_path}")
-            else:
-                # Save to default location
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                default_path = OUTPUTS_DIR / f"{service}_{source}_report_{timestamp}.html"
-                default_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(default_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                logger.info(f"HTML report saved to {default_path}")
-                save_path = str(default_path)
-            
-            return save_path
-            
-        except Exception as e:
-            logger.error(f"Error generating HTML report: {e}")
-            return ""
-    
-    def generate_pdf_report(self, analysis_results: Dict[str, Any],
-                          service: str, source: str,
-                          save_path: Optional[str] = None) -> str:
-        """Generate PDF report"""
-        try:
-            # First generate HTML report
-            html_path = self.generate_html_report(analysis_results, service, source)
-            
-            if not html_path:
-                return ""
-            
-            # Convert HTML to PDF (simplified approach)
-            # Note: For production, you'd want to use a proper HTML to PDF converter
-            # like WeasyPrint, pdfkit, or reportlab
-            
-            if save_path:
-                # Copy HTML content to PDF path (placeholder)
-                with open(html_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Save as PDF (this is a placeholder - real implementation would need proper conversion)
-                pdf_path = save_path
-                with open(pdf_path, 'w', encoding='utf-8') as f:
-                    f.write(f"PDF version of report\n\n{html_content[:1000]}...")
-                
-                logger.info(f"PDF report saved to {pdf_path}")
-                return pdf_path
-            else:
-                # Use HTML path as fallback
-                return html_path
-                
-        except Exception as e:
-            logger.error(f"Error generating PDF report: {e}")
-            return ""
-    
-    def generate_summary_report(self, analysis_results: Dict[str, Any],
-                              service: str, source: str) -> Dict[str, Any]:
-        """Generate summary report data"""
-        try:
-            summary = {
-                'metadata': {
-                    'service': service,
-                    'source': source,
-                    'generated_at': datetime.now().isoformat(),
-                    'report_version': '1.0'
-                },
-                'executive_summary': self._generate_executive_summary(analysis_results),
-                'detailed_findings': self._generate_detailed_findings(analysis_results),
-                'recommendations': self._generate_recommendations(analysis_results),
-                'technical_details': self._generate_technical_details(analysis_results)
-            }
-            
-            return summary
-            
-        except Exception as e:
-            logger.error(f"Error generating summary report: {e}")
-            return {'error': str(e)}
-    
-    def _build_html_report(self, analysis_results: Dict[str, Any], 
-                          service: str, source: str,
-                          charts_data: Dict[str, str]) -> str:
-        """Build HTML report content"""
+# matplotlib (and the chart generators built on it) is imported on first chart use;
+# None = not tried yet, False = unavailable
+_PLT = None
+
+def _get_plt():
+    """Return matplotlib.pyplot, importing it on first call (None if unavailable)"""
+    global _PLT
+    if _PLT is False:
+        return None
+    if _PLT is None:
         try:
-            # Generate timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Extract key data
-            sentiment_summary = analysis_results.get('sentiment_summary', {})
-            keywords = analysis_results.get('keywords', [])
-            temporal_data = analysis_results.get('temporal_data', [])
-            extraction_stats = analysis_results.get('extraction_stats', {})
-            
-            # Build HTML
-            html = f"""
+            from matplotlib import pyplot as plt
+            _PLT = plt
+        except ImportError:
+            _PLT = False
+            return None
+    return _PLT
+
+# Static document head (styles included); only the title fields are substituted
+_HTML_HEAD_TEMPLATE = Template("""
             <!DOCTYPE html>
             <html lang="fr">
             <head>
                 <meta charset="UTF-8">
                 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Social Media Sentiment Analysis Report - {service}</title>
+                <title>Social Media Sentiment Analysis Report - ${service}</title>
                 <style>
-                    body {{
+                    body {
                         font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
                         line-height: 1.6;
                         margin: 0;
                         padding: 20px;
                         background-color: #f5f5f5;
-                    }}
-                    .container {{
+                    }
+                    .container {
                         max-width: 1200px;
                         margin: 0 auto;
                         background-color: white;
                         padding: 30px;
                         border-radius: 10px;
                         box-shadow: 0 0 20px rgba(0,0,0,0.1);
-                    }}
-                    h1 {{
+                    }
+                    h1 {
                         color: #2c3e50;
                         text-align: center;
                         border-bottom: 3px solid #3498db;
                         padding-bottom: 10px;
-                    }}
-                    h2 {{
+                    }
+                    h2 {
                         color: #34495e;
                         border-left: 4px solid #3498db;
                         padding-left: 15px;
                         margin-top: 30px;
-                    }}
-                    h3 {{
+                    }
+                    h3 {
                         color: #2c3e50;
                         margin-top: 25px;
-                    }}
-                    .summary-box {{
+                    }
+                    .summary-box {
                         background-color: #ecf0f1;
                         padding: 20px;
                         border-radius: 8px;
                         margin: 20px 0;
                         border-left: 5px solid #3498db;
-                    }}
-                    .metric {{
+                    }
+                    .metric {
                         display: inline-block;
                         margin: 10px 20px 10px 0;
                         padding: 10px 15px;
@@ -191,264 +103,631 @@ class ReportGenerator:
                         color: white;
                         border-radius: 5px;
                         font-weight: bold;
-                    }}
-                    .positive {{ background-color: #27ae60; }}
-                    .negative {{ background-color: #e74c3c; }}
-                    .neutral {{ background-color: #95a5a6; }}
-                    .chart-container {{
+                    }
+                    .positive { background-color: #27ae60; }
+                    .negative { background-color: #e74c3c; }
+                    .neutral { background-color: #95a5a6; }
+                    .chart-container {
                         text-align: center;
                         margin: 20px 0;
                         padding: 15px;
                         background-color: #fafafa;
                         border-radius: 8px;
-                    }}
-                    .chart-container img {{
+                    }
+                    .chart-container img {
                         max-width: 100%;
                         height: auto;
                         border-radius: 5px;
                         box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    }}
-                    table {{
+                    }
+                    table {
                         width: 100%;
                         border-collapse: collapse;
                         margin: 20px 0;
-                    }}
-                    th, td {{
+                    }
+                    th, td {
                         padding: 12px;
                         text-align: left;
                         border-bottom: 1px solid #ddd;
-                    }}
-                    th {{
+                    }
+                    th {
                         background-color: #3498db;
                         color: white;
                         font-weight: bold;
-                    }}
-                    tr:nth-child(even) {{
+                    }
+                    tr:nth-child(even) {
                         background-color: #f2f2f2;
-                    }}
-                    .keyword-list {{
+                    }
+                    .keyword-list {
                         display: flex;
                         flex-wrap: wrap;
                         gap: 10px;
                         margin: 15px 0;
-                    }}
-                    .keyword-tag {{
+                    }
+                    .keyword-tag {
                         background-color: #3498db;
                         color: white;
                         padding: 5px 10px;
                         border-radius: 15px;
                         font-size: 0.9em;
-                    }}
-                    .footer {{
+                    }
+                    .footer {
                         text-align: center;
                         margin-top: 40px;
                         padding-top: 20px;
                         border-top: 1px solid #ddd;
                         color: #7f8c8d;
                         font-size: 0.9em;
-                    }}
-                    .recommendation {{
+                    }
+                    .recommendation {
                         background-color: #fff3cd;
                         border: 1px solid #ffeaa7;
                         border-radius: 5px;
                         padding: 15px;
                         margin: 10px 0;
-                    }}
-                    .recommendation h4 {{
+                    }
+                    .recommendation h4 {
                         color: #856404;
                         margin-top: 0;
-                    }}
+                    }
                 </style>
             </head>
             <body>
                 <div class="container">
                     <h1>Social Media Sentiment Analysis Report</h1>
-                    <h2 style="text-align: center; color: #3498db;">Service: {service} | Source: {source}</h2>
-                    <p style="text-align: center; color: #7f8c8d; font-style: italic;">Generated on {timestamp}</p>
+                    <h2 style="text-align: center; color: #3498db;">Service: ${service} | Source: ${source}</h2>
+                    <p style="text-align: center; color: #7f8c8d; font-style: italic;">Generated on ${timestamp}</p>""")
+
+_KW_ROW = "<tr><td>{i}</td><td><strong>{kw}</strong></td><td>{f}</td><td>{s:.3f}</td><td>{m}</td></tr>"
+
+_IMG_TAG_SUFFIX = b'" alt="Chart" style="max-width: 100%; height: auto;">'
+
+_HTML_TAIL = """
+                </div>
+            </body>
+            </html>
+            """
+
+def _error_html(error: Exception) -> str:
+    """Minimal page written in place of a report that failed to build"""
+    return f"<html><body><h1>Error generating report: {error}</h1></body></html>"
+
+def _write_text(path, text: str):
+    """Write text as pre-encoded UTF-8 in a single write"""
+    with open(path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+# Shared read-only fallback for missing nested dicts (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# (label, css class) for mixed / predominantly positive / predominantly negative
+_SENT = (
+    ("mixed", "neutral"),
+    ("predominantly positive", "positive"),
+    ("predominantly negative", "negative"),
+)
+
+# Average polarity labels, indexed by _polarity_index
+_POL = ('Neutral', 'Positive', 'Negative')
+_POL_LOWER = ('neutral', 'positive', 'negative')
+
+def _polarity_index(avg_polarity: float) -> int:
+    """0 = neutral, 1 = positive (> 0.1), 2 = negative (< -0.1)"""
+    return (avg_polarity > 0.1) + 2 * (avg_polarity < -0.1)
+
+# Extra PIL encoder options per embedded image format
+_PIL_SAVE_OPTIONS = {
+    'png': {'compress_level': 9},
+}
+
+def _savefig_kwargs(image_format: str, dpi: int) -> Dict[str, Any]:
+    """Keyword arguments for fig.savefig when embedding charts in reports"""
+    kwargs = {'format': image_format, 'dpi': dpi, 'bbox_inches': 'tight'}
+    if image_format in _PIL_SAVE_OPTIONS:
+        kwargs['pil_kwargs'] = _PIL_SAVE_OPTIONS[image_format]
+    return kwargs
+
+@dataclass(frozen=True, slots=True)
+class _Summary:
+    """Sentiment summary fields read by several report sections"""
+    available: bool
+    total: int
+    positive: float
+    negative: float
+    neutral: float
+    avg_polarity: float
+    avg_confidence: float
+
+@dataclass(slots=True)
+class _Charts:
+    """Embedded <img> HTML per report chart ("" when not generated)"""
+    sentiment_pie: str = ""
+    sentiment_bar: str = ""
+    sentiment_trend: str = ""
+    keyword_frequency: str = ""
+    keyword_score: str = ""
+    wordcloud: str = ""
+
+# Per-process ChartsGenerator and image buffer used by chart rendering workers
+_WORKER_CHARTS: Optional['ChartsGenerator'] = None
+_WORKER_BUF = io.BytesIO()
+
+def _init_chart_worker(log_queue, level: int):
+    """Prepare a chart worker: log through the parent and use the GUI-free backend"""
+    init_worker_logging(log_queue, level)
+    import matplotlib
+    matplotlib.use('Agg')
+
+def _render_chart_png(factory: str, data: Any, image_format: str = 'png',
+                      dpi: int = 96) -> bytes:
+    """Build one chart in a worker process and return its encoded image bytes"""
+    global _WORKER_CHARTS
+    from matplotlib import pyplot as plt
+    
+    if _WORKER_CHARTS is None:
+        from .charts_generator import ChartsGenerator
+        _WORKER_CHARTS = ChartsGenerator()
+    
+    fig = getattr(_WORKER_CHARTS, factory)(data)
+    try:
+        img_buffer = _WORKER_BUF
+        img_buffer.seek(0)
+        img_buffer.truncate()
+        fig.savefig(img_buffer, **_savefig_kwargs(image_format, dpi))
+        return img_buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+class ReportGenerator:
+    """Generate comprehensive analysis reports"""
+    
+    # Below this many charts, rendering in-process beats pool startup
+    PARALLEL_CHARTS_MIN_JOBS = 3
+    
+    # (analysis_results key, ChartsGenerator method, charts_data key)
+    _CHART_JOBS = (
+        ('sentiment_summary', 'create_sentiment_pie_chart', 'sentiment_pie'),
+        ('sentiment_summary', 'create_sentiment_bar_chart', 'sentiment_bar'),
+        ('temporal_data', 'create_sentiment_trend_chart', 'sentiment_trend'),
+        ('keywords', 'create_keyword_frequency_chart', 'keyword_frequency'),
+        ('keywords', 'create_keyword_score_chart', 'keyword_score'),
+    )
+    
+    def __init__(self, dpi: int = 96, image_format: str = 'png'):
+        # Screen resolution by default; raise dpi for print-quality reports
+        self.dpi = dpi
+        self.image_format = image_format
+        self._img_tag_prefix = f'<img src="data:image/{image_format};base64,'.encode('ascii')
+        self._charts_generator: Optional['ChartsGenerator'] = None
+        self._wordcloud_generator: Optional['WordCloudGenerator'] = None
+        self._chart_executor: Optional[ProcessPoolExecutor] = None
+        # Reused for every in-process figure encode
+        self._img_buf = io.BytesIO()
+    
+    @property
+    def charts_generator(self) -> 'ChartsGenerator':
+        """Chart generator, created on first chart request"""
+        if self._charts_generator is None:
+            from .charts_generator import ChartsGenerator
+            self._charts_generator = ChartsGenerator()
+        return self._charts_generator
+    
+    @property
+    def wordcloud_generator(self) -> 'WordCloudGenerator':
+        """Word cloud generator, created on first chart request"""
+        if self._wordcloud_generator is None:
+            from .wordcloud_generator import WordCloudGenerator
+            self._wordcloud_generator = WordCloudGenerator()
+        return self._wordcloud_generator
+    
+    def close(self):
+        """Shut down the chart rendering worker pool, if started"""
+        if self._chart_executor is not None:
+            self._chart_executor.shutdown()
+            self._chart_executor = None
+    
+    def __enter__(self) -> 'ReportGenerator':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def generate_html_report(self, analysis_results: Dict[str, Any], 
+                           service: str, source: str,
+                           save_path: Optional[str] = None) -> str:
+        """Generate comprehensive HTML report"""
+        try:
+            now = datetime.now()
+            
+            # Generate charts and word clouds
+            charts_data = self._generate_charts_data(analysis_results)
+            
+            # Stream the report sections straight to the file
+            report_path = self._report_path(
+                service, source, now.strftime("%Y%m%d_%H%M%S"), save_path
+            )
+            chunks = self._iter_html_report(
+                analysis_results, service, source, charts_data,
+                now.strftime("%Y-%m-%d %H:%M:%S")
+            )
+            with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                try:
+                    for chunk in chunks:
+                        f.write(chunk)
+                except Exception as e:
+                    logger.error(f"Error building HTML report: {e}")
+                    f.seek(0)
+                    f.truncate()
+                    f.write(_error_html(e))
+            
+            logger.info(f"HTML report saved to {report_path}")
+            return str(report_path)
+            
+        except Exception as e:
+            logger.error(f"Error generating HTML report: {e}")
+            return ""
+    
+    def generate_pdf_report(self, analysis_results: Dict[str, Any],
+                          service: str, source: str,
+                          save_path: Optional[str] = None) -> str:
+        """Generate PDF report"""
+        try:
+            # Render the HTML once and reuse it in memory
+            now = datetime.now()
+            html_content = self._render_html(
+                analysis_results, service, source, now.strftime("%Y-%m-%d %H:%M:%S")
+            )
+            
+            if not html_content:
+                return ""
+            
+            # Convert HTML to PDF (simplified approach)
+            # Note: For production, you'd want to use a proper HTML to PDF converter
+            # like WeasyPrint, pdfkit, or reportlab
+            
+            if save_path:
+                # Save as PDF (this is a placeholder - real implementation would need proper conversion)
+                pdf_path = save_path
+                with open(pdf_path, 'w', encoding='utf-8') as f:
+                    f.write(f"PDF version of report\n\n{html_content[:1000]}...")
+                
+                logger.info(f"PDF report saved to {pdf_path}")
+                return pdf_path
+            else:
+                # Use HTML report as fallback
+                return self._save_html_report(
+                    html_content, service, source, now.strftime("%Y%m%d_%H%M%S")
+                )
+                
+        except Exception as e:
+            logger.error(f"Error generating PDF report: {e}")
+            return ""
+    
+    def generate_summary_report(self, analysis_results: Dict[str, Any],
+                              service: str, source: str) -> Dict[str, Any]:
+        """Generate summary report data"""
+        try:
+            metadata = {
+                'service': service,
+                'source': source,
+                'generated_at': datetime.now().isoformat(),
+                'report_version': '1.0'
+            }
+            
+            # Nothing to summarize without sentiment results
+            if not analysis_results or 'sentiment_summary' not in analysis_results:
+                return {'metadata': metadata, 'error': 'no analyzable data'}
+            
+            s = self._extract_summary(analysis_results)
+            keywords = analysis_results.get('keywords') or []
+            summary = {
+                'metadata': metadata,
+                'executive_summary': self._generate_executive_summary(s, keywords),
+                'detailed_findings': self._generate_detailed_findings(analysis_results, s, keywords),
+                'recommendations': self._generate_recommendations(s),
+                'technical_details': self._generate_technical_details(analysis_results, s)
+            }
+            
+            return summary
+            
+        except Exception as e:
+            logger.error(f"Error generating summary report: {e}")
+            return {'error': str(e)}
+    
+    def generate_summary_report_json(self, analysis_results: Dict[str, Any],
+                                   service: str, source: str) -> bytes:
+        """Generate summary report serialized as UTF-8 JSON bytes"""
+        summary = self.generate_summary_report(analysis_results, service, source)
+        
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                summary,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        
+        return json.dumps(
+            summary, ensure_ascii=False, separators=(',', ':'), default=str
+        ).encode('utf-8')
+    
+    def _extract_summary(self, analysis_results: Dict[str, Any]) -> _Summary:
+        """Read the sentiment summary fields once for all report sections"""
+        sentiment_summary = analysis_results.get('sentiment_summary') or _EMPTY
+        percentages = sentiment_summary.get('percentages') or _EMPTY
+        
+        return _Summary(
+            available=bool(sentiment_summary),
+            total=sentiment_summary.get('total', 0),
+            positive=percentages.get('positive', 0),
+            negative=percentages.get('negative', 0),
+            neutral=percentages.get('neutral', 0),
+            avg_polarity=sentiment_summary.get('average_polarity', 0),
+            avg_confidence=sentiment_summary.get('average_confidence', 0)
+        )
+    
+    def _render_html(self, analysis_results: Dict[str, Any],
+                     service: str, source: str, timestamp: str) -> str:
+        """Render the HTML report content without writing it"""
+        # Generate charts and word clouds
+        charts_data = self._generate_charts_data(analysis_results)
+        
+        # Build HTML content
+        return self._build_html_report(
+            analysis_results, service, source, charts_data, timestamp
+        )
+    
+    def _report_path(self, service: str, source: str, file_timestamp: str,
+                     save_path: Optional[str] = None):
+        """Resolve where an HTML report is written"""
+        if save_path:
+            return save_path
+        
+        # Save to default location
+        default_path = OUTPUTS_DIR / f"{service}_{source}_report_{file_timestamp}.html"
+        default_path.parent.mkdir(parents=True, exist_ok=True)
+        return default_path
+    
+    def _save_html_report(self, html_content: str, service: str, source: str,
+                          file_timestamp: str, save_path: Optional[str] = None) -> str:
+        """Write rendered HTML to save_path or the default outputs location"""
+        report_path = self._report_path(service, source, file_timestamp, save_path)
+        _write_text(report_path, html_content)
+        logger.info(f"HTML report saved to {report_path}")
+        return str(report_path)
+    
+    def _build_html_report(self, analysis_results: Dict[str, Any], 
+                          service: str, source: str,
+                          charts_data: _Charts, timestamp: str) -> str:
+        """Build HTML report content"""
+        try:
+            return "".join(self._iter_html_report(
+                analysis_results, service, source, charts_data, timestamp
+            ))
+            
+        except Exception as e:
+            logger.error(f"Error building HTML report: {e}")
+            return _error_html(e)
+    
+    def _iter_html_report(self, analysis_results: Dict[str, Any], 
+                          service: str, source: str,
+                          charts_data: _Charts, timestamp: str) -> Iterator[str]:
+        """Yield the HTML report section by section"""
+        # Extract key data
+        summary = self._extract_summary(analysis_results)
+        keywords = analysis_results.get('keywords', [])
+        temporal_data = analysis_results.get('temporal_data', [])
+        extraction_stats = analysis_results.get('extraction_stats') or _EMPTY
+        
+        # Build HTML
+        yield _HTML_HEAD_TEMPLATE.substitute(
+            service=escape(service), source=escape(source), timestamp=timestamp
+        )
+        yield f"""
                     
                     <div class="summary-box">
                         <h3>📊 Executive Summary</h3>
-                        {self._generate_executive_summary_html(sentiment_summary, keywords)}
+                        {self._generate_executive_summary_html(summary, keywords)}
                     </div>
                     
                     <h2>🎯 Sentiment Analysis Results</h2>
                     <div class="chart-container">
                         <h3>Sentiment Distribution</h3>
-                        {self._get_chart_html(charts_data.get('sentiment_pie'), 'Sentiment Pie Chart')}
+                        {self._get_chart_html(charts_data.sentiment_pie, 'Sentiment Pie Chart')}
                     </div>
                     
                     <div class="chart-container">
                         <h3>Sentiment Breakdown</h3>
-                        {self._get_chart_html(charts_data.get('sentiment_bar'), 'Sentiment Bar Chart')}
+                        {self._get_chart_html(charts_data.sentiment_bar, 'Sentiment Bar Chart')}
                     </div>
             """
-            
-            # Add temporal analysis if available
-            if temporal_data:
-                html += f"""
+        
+        # Add temporal analysis if available
+        if temporal_data:
+            yield f"""
                     <div class="chart-container">
                         <h3>Sentiment Trends Over Time</h3>
-                        {self._get_chart_html(charts_data.get('sentiment_trend'), 'Sentiment Trend Chart')}
+                        {self._get_chart_html(charts_data.sentiment_trend, 'Sentiment Trend Chart')}
                     </div>
                 """
-            
-            # Add keyword analysis
-            if keywords:
-                html += f"""
+        
+        # Add keyword analysis
+        if keywords:
+            yield f"""
                     <h2>🔑 Keyword Analysis</h2>
                     <div class="chart-container">
                         <h3>Top Keywords by Frequency</h3>
-                        {self._get_chart_html(charts_data.get('keyword_frequency'), 'Keyword Frequency Chart')}
+                        {self._get_chart_html(charts_data.keyword_frequency, 'Keyword Frequency Chart')}
                     </div>
                     
                     <div class="chart-container">
                         <h3>Top Keywords by Relevance Score</h3>
-                        {self._get_chart_html(charts_data.get('keyword_score'), 'Keyword Score Chart')}
+                        {self._get_chart_html(charts_data.keyword_score, 'Keyword Score Chart')}
                     </div>
                 """
-                
-                # Add keyword list
-                html += self._generate_keyword_list_html(keywords[:20])
             
-            # Add word cloud if available
-            if 'wordcloud' in charts_data:
-                html += f"""
+            # Add keyword list
+            yield self._generate_keyword_list_html(keywords[:20])
+        
+        # Add word cloud if available
+        if charts_data.wordcloud:
+            yield f"""
                     <div class="chart-container">
                         <h3>Keywords Word Cloud</h3>
-                        {self._get_chart_html(charts_data.get('wordcloud'), 'Keywords Word Cloud')}
+                        {self._get_chart_html(charts_data.wordcloud, 'Keywords Word Cloud')}
                     </div>
                 """
-            
-            # Add technical details
-            html += f"""
+        
+        # Add technical details
+        yield f"""
                     <h2>⚙️ Technical Details</h2>
                     {self._generate_technical_details_html(analysis_results, extraction_stats)}
                     
                     <div class="footer">
                         <p>Generated by Social Media Sentiment Analysis Tool</p>
                         <p>Report generated on {timestamp}</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-            
-            return html
-            
-        except Exception as e:
-            logger.error(f"Error building HTML report: {e}")
-            return f"<html><body><h1>Error generating report: {e}</h1></body></html>"
+                    </div>"""
+        yield _HTML_TAIL
+    
+    def _generate_charts_data(self, analysis_results: Dict[str, Any]) -> _Charts:
+        """Resolve chart support on first use, then bind the matching implementation"""
+        if _get_plt() is None:
+            impl = lambda _r: _Charts()
+        else:
+            impl = self._generate_charts_data_impl
+        self._generate_charts_data = impl
+        return impl(analysis_results)
     
-    def _generate_charts_data(self, analysis_results: Dict[str, Any]) -> Dict[str, str]:
+    def _generate_charts_data_impl(self, analysis_results: Dict[str, Any]) -> _Charts:
         """Generate charts and convert to base64 for HTML embedding"""
-        charts_data = {}
+        charts_data = _Charts()
         
         try:
-            if MATPLOTLIB_AVAILABLE:
-                # Generate sentiment pie chart
-                if 'sentiment_summary' in analysis_results:
-                    fig = self.charts_generator.create_sentiment_pie_chart(
-                        analysis_results['sentiment_summary']
-                    )
-                    charts_data['sentiment_pie'] = self._figure_to_base64(fig)
-                    plt.close(fig)
-                
-                # Generate sentiment bar chart
-                if 'sentiment_summary' in analysis_results:
-                    fig = self.charts_generator.create_sentiment_bar_chart(
-                        analysis_results['sentiment_summary']
-                    )
-                    charts_data['sentiment_bar'] = self._figure_to_base64(fig)
-                    plt.close(fig)
-                
-                # Generate sentiment trend chart
-                if 'temporal_data' in analysis_results:
-                    fig = self.charts_generator.create_sentiment_trend_chart(
-                        analysis_results['temporal_data']
-                    )
-                    charts_data['sentiment_trend'] = self._figure_to_base64(fig)
-                    plt.close(fig)
-                
-                # Generate keyword charts
-                if 'keywords' in analysis_results:
-                    fig = self.charts_generator.create_keyword_frequency_chart(
-                        analysis_results['keywords']
-                    )
-                    charts_data['keyword_frequency'] = self._figure_to_base64(fig)
-                    plt.close(fig)
-                    
-                    fig = self.charts_generator.create_keyword_score_chart(
-                        analysis_results['keywords']
-                    )
-                    charts_data['keyword_score'] = self._figure_to_base64(fig)
-                    plt.close(fig)
-                
-                # Generate word cloud
-                if 'keywords' in analysis_results:
-                    wordcloud = self.wordcloud_generator.create_keyword_wordcloud(
-                        analysis_results['keywords']
+            # Independent chart jobs: (output key, ChartsGenerator method, data)
+            jobs = []
+            for data_key, factory, out_key in self._CHART_JOBS:
+                data = analysis_results.get(data_key)
+                if data is None:
+                    continue
+                jobs.append((out_key, factory, data))
+            
+            for key, chart_html in self._render_chart_jobs(jobs).items():
+                setattr(charts_data, key, chart_html)
+            
+            # Generate word cloud
+            if 'keywords' in analysis_results:
+                wordcloud = self.wordcloud_generator.create_keyword_wordcloud(
+                    analysis_results['keywords']
+                )
+                if wordcloud:
+                    # Encode the rendered cloud directly; the HTML already titles it
+                    img_buffer = self._img_buf
+                    img_buffer.seek(0)
+                    img_buffer.truncate()
+                    wordcloud.to_image().save(
+                        img_buffer,
+                        format=self.image_format.upper(),
+                        **_PIL_SAVE_OPTIONS.get(self.image_format, {})
                     )
-                    if wordcloud:
-                        fig = plt.figure(figsize=(10, 6))
-                        plt.imshow(wordcloud, interpolation='bilinear')
-                        plt.axis('off')
-                        plt.title('Keywords Word Cloud', fontsize=14, fontweight='bold')
-                        charts_data['wordcloud'] = self._figure_to_base64(fig)
-                        plt.close(fig)
+                    with img_buffer.getbuffer() as view:
+                        charts_data.wordcloud = self._bytes_to_base64_img(view)
             
         except Exception as e:
             logger.error(f"Error generating charts data: {e}")
         
         return charts_data
     
+    def _render_chart_jobs(self, jobs: List[tuple]) -> Dict[str, str]:
+        """Render chart jobs, in worker processes when there are enough of them"""
+        charts_data = {}
+        pending = jobs
+        # A single worker only adds process start-up and import cost
+        if len(jobs) >= self.PARALLEL_CHARTS_MIN_JOBS and (os.cpu_count() or 1) >= 2:
+            try:
+                if self._chart_executor is None:
+                    mp_context, log_queue, level = get_worker_logging()
+                    self._chart_executor = ProcessPoolExecutor(
+                        max_workers=min(6, os.cpu_count()),
+                        mp_context=mp_context,
+                        initializer=_init_chart_worker,
+                        initargs=(log_queue, level)
+                    )
+                futures = [
+                    (job, self._chart_executor.submit(
+                        _render_chart_png, job[1], job[2], self.image_format, self.dpi
+                    ))
+                    for job in jobs
+                ]
+                pending = []
+                pool_broken = False
+                for job, future in futures:
+                    try:
+                        charts_data[job[0]] = self._bytes_to_base64_img(future.result())
+                    except Exception as e:
+                        logger.warning(f"Chart {job[0]} failed in worker, rendering it here: {e}")
+                        pending.append(job)
+                        pool_broken = pool_broken or isinstance(e, BrokenProcessPool)
+                # A crashed worker breaks the whole pool; start a fresh one next time
+                if pool_broken:
+                    self.close()
+            except Exception as e:
+                logger.warning(f"Parallel chart rendering failed, rendering serially: {e}")
+                self.close()
+        
+        if pending:
+            plt = _get_plt()
+            for key, factory, data in pending:
+                fig = getattr(self.charts_generator, factory)(data)
+                charts_data[key] = self._figure_to_base64(fig)
+                plt.close(fig)
+        return charts_data
+    
+    def _bytes_to_base64_img(self, img_bytes) -> str:
+        """Wrap encoded image bytes (or a memoryview of them) in a base64 <img> tag"""
+        img_base64 = binascii.b2a_base64(img_bytes, newline=False)
+        return b''.join((self._img_tag_prefix, img_base64, _IMG_TAG_SUFFIX)).decode('ascii')
+    
     def _figure_to_base64(self, fig) -> str:
         """Convert matplotlib figure to base64 string"""
         try:
-            img_buffer = io.BytesIO()
-            fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
+            img_buffer = self._img_buf
             img_buffer.seek(0)
-            
-            img_base64 = base64.b64encode(img_buffer.read()).decode()
-            return f'<img src="data:image/png;base64,{img_base64}" alt="Chart" style="max-width: 100%; height: auto;">'
+            img_buffer.truncate()
+            fig.savefig(img_buffer, **_savefig_kwargs(self.image_format, self.dpi))
+            with img_buffer.getbuffer() as view:
+                return self._bytes_to_base64_img(view)
             
         except Exception as e:
             logger.error(f"Error converting figure to base64: {e}")
             return '<p>Error loading chart</p>'
     
-    def _get_chart_html(self, chart_data: Optional[str], alt_text: str) -> str:
+    def _get_chart_html(self, chart_data: str, alt_text: str) -> str:
         """Get HTML for chart with fallback"""
         if chart_data:
             return chart_data
         else:
             return f'<p style="text-align: center; color: gray; font-style: italic;">{alt_text} not available</p>'
     
-    def _generate_executive_summary_html(self, sentiment_summary: Dict[str, Any], 
+    def _generate_executive_summary_html(self, summary: _Summary, 
                                        keywords: List[Dict[str, Any]]) -> str:
         """Generate executive summary HTML"""
-        if not sentiment_summary:
+        if not summary.available:
             return "<p>No sentiment data available for summary.</p>"
         
-        total = sentiment_summary.get('total', 0)
-        positive_pct = sentiment_summary.get('percentages', {}).get('positive', 0)
-        negative_pct = sentiment_summary.get('percentages', {}).get('negative', 0)
-        neutral_pct = sentiment_summary.get('percentages', {}).get('neutral', 0)
-        avg_polarity = sentiment_summary.get('average_polarity', 0)
+        total = summary.total
+        positive_pct = summary.positive
+        negative_pct = summary.negative
+        neutral_pct = summary.neutral
+        avg_polarity = summary.avg_polarity
         
         # Determine overall sentiment
-        if positive_pct > 50:
-            overall_sentiment = "predominantly positive"
-            sentiment_color = "positive"
-        elif negative_pct > 50:
-            overall_sentiment = "predominantly negative"
-            sentiment_color = "negative"
-        else:
-            overall_sentiment = "mixed"
-            sentiment_color = "neutral"
+        idx = 1 if positive_pct > 50 else (2 if negative_pct > 50 else 0)
+        overall_sentiment, sentiment_color = _SENT[idx]
         
         # Top keywords
         top_keywords = keywords[:5] if keywords else []
         
-        html = f"""
+        parts: List[str] = []
+        parts.append(f"""
             <div style="margin-bottom: 20px;">
                 <p><strong>Overall Assessment:</strong> The sentiment analysis reveals a <span class="{sentiment_color}">{overall_sentiment}</span> 
                 response to the service across social media platforms.</p>
@@ -463,28 +742,39 @@ class ReportGenerator:
             
             <div style="margin-bottom: 20px;">
                 <p><strong>Average Sentiment Score:</strong> {avg_polarity:.3f} 
-                ({'Positive' if avg_polarity > 0.1 else 'Negative' if avg_polarity < -0.1 else 'Neutral'})</p>
+                ({_POL[_polarity_index(avg_polarity)]})</p>
             </div>
-        """
+        """)
         
         if top_keywords:
-            html += """
+            parts.append("""
             <div>
                 <p><strong>Top Keywords:</strong></p>
                 <div class="keyword-list">
-            """
+            """)
             for keyword in top_keywords:
-                html += f'<span class="keyword-tag">{keyword["keyword"]}</span>'
-            html += "</div></div>"
+                parts.append(f'<span class="keyword-tag">{escape(keyword["keyword"])}</span>')
+            parts.append("</div></div>")
         
-        return html
+        return "".join(parts)
     
     def _generate_keyword_list_html(self, keywords: List[Dict[str, Any]]) -> str:
         """Generate keyword list HTML"""
         if not keywords:
             return ""
         
-        html = """
+        rows = "".join(
+            _KW_ROW.format(
+                i=i,
+                kw=escape(k['keyword']),
+                f=k['frequency'],
+                s=k['score'],
+                m=k.get('method', 'unknown')
+            )
+            for i, k in enumerate(keywords, 1)
+        )
+        
+        return f"""
             <h2>📋 Complete Keyword List</h2>
             <table>
                 <thead>
@@ -497,57 +787,42 @@ class ReportGenerator:
                     </tr>
                 </thead>
                 <tbody>
-        """
-        
-        for i, keyword in enumerate(keywords, 1):
-            html += f"""
-                <tr>
-                    <td>{i}</td>
-                    <td><strong>{keyword['keyword']}</strong></td>
-                    <td>{keyword['frequency']}</td>
-                    <td>{keyword['score']:.3f}</td>
-                    <td>{keyword.get('method', 'unknown')}</td>
-                </tr>
-            """
-        
-        html += """
+        {rows}
                 </tbody>
             </table>
         """
-        
-        return html
     
     def _generate_technical_details_html(self, analysis_results: Dict[str, Any], 
                                        extraction_stats: Dict[str, Any]) -> str:
         """Generate technical details HTML"""
-        html = "<div class='summary-box'>"
+        parts: List[str] = ["<div class='summary-box'>"]
         
         # Extraction statistics
         if extraction_stats:
-            html += f"""
+            parts.append(f"""
                 <h4>Data Extraction Statistics</h4>
                 <ul>
                     <li>Posts Extracted: {extraction_stats.get('posts_extracted', 0)}</li>
                     <li>Errors Encountered: {extraction_stats.get('errors_count', 0)}</li>
                     <li>Success Rate: {extraction_stats.get('success_rate', 0):.1f}%</li>
                 </ul>
-            """
+            """)
         
         # Analysis parameters
         if 'parameters' in analysis_results:
             params = analysis_results['parameters']
-            html += f"""
+            parts.append(f"""
                 <h4>Analysis Parameters</h4>
                 <ul>
-                    <li>Service: {params.get('service', 'Unknown')}</li>
-                    <li>Source: {params.get('source', 'Unknown')}</li>
+                    <li>Service: {escape(str(params.get('service', 'Unknown')))}</li>
+                    <li>Source: {escape(str(params.get('source', 'Unknown')))}</li>
                     <li>Time Period: {params.get('days', 0)} days</li>
                     <li>Max Posts: {params.get('max_posts', 0)}</li>
                 </ul>
-            """
+            """)
         
         # Processing details
-        html += """
+        parts.append("""
             <h4>Processing Details</h4>
             <ul>
                 <li>Sentiment Analysis: Multi-model approach (TextBlob + Transformers)</li>
@@ -555,23 +830,21 @@ class ReportGenerator:
                 <li>Language Support: French and English</li>
                 <li>Data Validation: Comprehensive filtering and cleaning</li>
             </ul>
-        """
+        """)
         
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return "".join(parts)
     
-    def _generate_executive_summary(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_executive_summary(self, summary: _Summary,
+                                    keywords: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate executive summary"""
-        sentiment_summary = analysis_results.get('sentiment_summary', {})
-        keywords = analysis_results.get('keywords', [])
-        
-        if not sentiment_summary:
+        if not summary.available:
             return {'error': 'No sentiment data available'}
         
-        total = sentiment_summary.get('total', 0)
-        positive_pct = sentiment_summary.get('percentages', {}).get('positive', 0)
-        negative_pct = sentiment_summary.get('percentages', {}).get('negative', 0)
-        avg_polarity = sentiment_summary.get('average_polarity', 0)
+        total = summary.total
+        positive_pct = summary.positive
+        negative_pct = summary.negative
+        avg_polarity = summary.avg_polarity
         
         # Key insights
         insights = []
@@ -590,34 +863,34 @@ class ReportGenerator:
                 'negative': negative_pct,
                 'neutral': 100 - positive_pct - negative_pct
             },
-            'overall_sentiment': 'positive' if avg_polarity > 0.1 else 'negative' if avg_polarity < -0.1 else 'neutral',
+            'overall_sentiment': _POL_LOWER[_polarity_index(avg_polarity)],
             'key_insights': insights,
             'top_themes': top_keywords
         }
     
-    def _generate_detailed_findings(self, analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_detailed_findings(self, analysis_results: Dict[str, Any],
+                                    summary: _Summary,
+                                    keywords: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate detailed findings"""
         findings = []
         
         # Sentiment findings
-        if 'sentiment_summary' in analysis_results:
-            sentiment = analysis_results['sentiment_summary']
-            findings.append({
-                'category': 'Sentiment Analysis',
-                'finding': f"Overall sentiment is {sentiment.get('average_polarity', 0):.3f} "
-                          f"({'positive' if sentiment.get('average_polarity', 0) > 0.1 else 'negative' if sentiment.get('average_polarity', 0) < -0.1 else 'neutral'})",
-                'confidence': sentiment.get('average_confidence', 0)
-            })
+        avg_polarity = summary.avg_polarity
+        findings.append({
+            'category': 'Sentiment Analysis',
+            'finding': f"Overall sentiment is {avg_polarity:.3f} "
+                      f"({_POL_LOWER[_polarity_index(avg_polarity)]})",
+            'confidence': summary.avg_confidence
+        })
         
         # Keyword findings
-        if 'keywords' in analysis_results:
-            keywords = analysis_results['keywords'][:5]
-            if keywords:
-                findings.append({
-                    'category': 'Key Themes',
-                    'finding': f"Top themes include: {', '.join([kw['keyword'] for kw in keywords])}",
-                    'confidence': 0.8
-                })
+        top_keywords = keywords[:5]
+        if top_keywords:
+            findings.append({
+                'category': 'Key Themes',
+                'finding': f"Top themes include: {', '.join([kw['keyword'] for kw in top_keywords])}",
+                'confidence': 0.8
+            })
         
         # Temporal findings
         if 'temporal_data' in analysis_results:
@@ -629,13 +902,12 @@ class ReportGenerator:
         
         return findings
     
-    def _generate_recommendations(self, analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_recommendations(self, summary: _Summary) -> List[Dict[str, Any]]:
         """Generate recommendations based on analysis"""
         recommendations = []
         
-        sentiment_summary = analysis_results.get('sentiment_summary', {})
-        positive_pct = sentiment_summary.get('percentages', {}).get('positive', 0)
-        negative_pct = sentiment_summary.get('percentages', {}).get('negative', 0)
+        positive_pct = summary.positive
+        negative_pct = summary.negative
         
         if negative_pct > 30:
             recommendations.append({
@@ -659,13 +931,14 @@ class ReportGenerator:
         
         return recommendations
     
-    def _generate_technical_details(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_technical_details(self, analysis_results: Dict[str, Any],
+                                    summary: _Summary) -> Dict[str, Any]:
         """Generate technical details"""
         return {
-            'extraction_method': analysis_results.get('extraction_stats', {}).get('method', 'API + Scraping'),
+            'extraction_method': (analysis_results.get('extraction_stats') or _EMPTY).get('method', 'API + Scraping'),
             'sentiment_models': ['TextBlob', 'Transformers'],
             'keyword_methods': ['TF-IDF', 'Frequency', 'TextRank'],
             'languages_supported': ['French', 'English'],
             'data_validation': 'Comprehensive filtering applied',
-            'sample_size': analysis_results.get('sentiment_summary', {}).get('total', 0)
+            'sample_size': summary.total
         }
\ No newline at end of file
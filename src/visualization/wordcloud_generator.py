@@ -2,35 +2,198 @@
 Word cloud generator for keyword visualization.
 Creates word clouds from keywords and text data.
 """
-from typing import List, Dict, Any, Optional
+import heapq
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import numpy as np
 from PIL import Image
 
+try:
+    import matplotlib
+    # Batch rendering never needs a GUI; respect an explicitly chosen backend
+    if not os.environ.get('MPLBACKEND'):
+        matplotlib.use('Agg')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+
 try:
     from wordcloud import WordCloud, STOPWORDS
     WORDCLOUD_AVAILABLE = True
+    _BASE_STOPWORDS = frozenset(STOPWORDS)
 except ImportError:
     WORDCLOUD_AVAILABLE = False
+    _BASE_STOPWORDS = frozenset()
 
 from ..config import VizConfig
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, get_worker_logging, init_worker_logging
 
 logger = get_logger(__name__)
 
+# Saved figures: ~native word cloud resolution, Pillow's default PNG compression
+_SAVEFIG_KWARGS = {
+    'dpi': 150,
+    'bbox_inches': 'tight'
+}
+
+# Word tokens, apostrophes allowed after the first character (WordCloud's default pattern)
+_TOKEN_RE = re.compile(r"\w[\w']*", re.UNICODE)
+
+def _tokens(text: str, stopwords: set) -> Iterator[str]:
+    """Word tokens of a text with a trailing 's removed, skipping stopwords and bare numbers"""
+    for word in _TOKEN_RE.findall(text):
+        if word[-2:].lower() == "'s":
+            word = word[:-2]
+        if not word.isdigit() and word.lower() not in stopwords:
+            yield word
+
+def _word_frequencies(counts: Counter, limit: int) -> Dict[str, int]:
+    """Merge case variants and plurals as WordCloud.generate does, keeping the top words"""
+    # Case variants per lowercased word, one step per distinct token
+    cases_by_lower: Dict[str, Dict[str, int]] = {}
+    for word, count in counts.items():
+        cases_by_lower.setdefault(word.lower(), {})[word] = count
+    
+    # Fold a plural into its singular when both occur ("dogs" -> "dog", never "class")
+    for key in list(cases_by_lower):
+        if key.endswith('s') and not key.endswith('ss') and key[:-1] in cases_by_lower:
+            singular_cases = cases_by_lower[key[:-1]]
+            for word, count in cases_by_lower.pop(key).items():
+                singular_cases[word[:-1]] = singular_cases.get(word[:-1], 0) + count
+    
+    # Each word is shown in its most frequent case with the summed count
+    merged = Counter({
+        max(cases.items(), key=itemgetter(1))[0]: sum(cases.values())
+        for cases in cases_by_lower.values()
+    })
+    return dict(merged.most_common(limit))
+
+@lru_cache(maxsize=32)
+def _resolve_stopwords(language: Optional[str], extra: frozenset) -> frozenset:
+    """Merge WordCloud, additional and language-specific stopwords once per combination"""
+    # Common case: share the base set, no copy
+    if not extra and language is None:
+        return _BASE_STOPWORDS
+    
+    stopwords = set(_BASE_STOPWORDS)
+    stopwords.update(word.lower() for word in extra)
+    
+    # Add language-specific stopwords (imported here: the preprocessor loads nltk)
+    if language is not None:
+        try:
+            from ..nlp.text_preprocessor import TextPreprocessor
+        except ImportError:
+            return frozenset(stopwords)
+        preprocessor = TextPreprocessor(language)
+        if hasattr(preprocessor, 'stop_words'):
+            for lang_stopwords in preprocessor.stop_words.values():
+                stopwords.update(lang_stopwords)
+    
+    return frozenset(stopwords)
+
+def _weight(kw: Dict[str, Any]) -> float:
+    """Keyword weight: its score, falling back to frequency"""
+    if 'score' in kw:
+        return kw['score']
+    return kw.get('frequency', 1)
+
+def _top_frequencies(weighted_words: Iterable[Tuple[float, str]], limit: int) -> Dict[str, float]:
+    """Keep the highest-weighted words only; WordCloud never draws more than limit"""
+    return {word: weight for weight, word in heapq.nlargest(limit, weighted_words)}
+
+def _group_texts_by_sentiment(sentiment_results: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Group usable result texts by sentiment in a single sweep"""
+    by_sent = {'positive': [], 'negative': [], 'neutral': []}
+    for result in sentiment_results:
+        text = result.get('text', '')
+        if text and text != '...':  # Skip truncated indicators
+            texts = by_sent.get(result['sentiment'])
+            if texts is not None:
+                texts.append(text)
+    return by_sent
+
 class WordCloudGenerator:
     """Generate word clouds from keywords and text data"""
     
+    __slots__ = (
+        '_mask_cache', '_fig', '_canvas',
+        '_grid_fig', '_grid_axes', 'language'
+    )
+    
+    # Read once from VizConfig when the class is defined
+    _WIDTH = VizConfig.WC_WIDTH
+    _HEIGHT = VizConfig.WC_HEIGHT
+    _MAX_WORDS = VizConfig.WC_MAX_WORDS
+    _COLLOC = VizConfig.WC_COLLOCATIONS
+    
+    # (sentiment, colormap, grid panel title) for the sentiment clouds
+    _SENTIMENT_PANELS = (
+        ('positive', 'Greens', 'Positive Sentiment'),
+        ('negative', 'Reds', 'Negative Sentiment'),
+        ('neutral', 'Grays', 'Neutral Sentiment')
+    )
+    
     def __init__(self):
-        self.width = VizConfig.WC_WIDTH
-        self.height = VizConfig.WC_HEIGHT
-        self.max_words = VizConfig.WC_MAX_WORDS
-        self.collocations = VizConfig.WC_COLLOCATIONS
+        # Loaded masks keyed by (path, mtime, file size)
+        self._mask_cache: Dict[Tuple, np.ndarray] = {}
+        # Single figure reused by _visualize_wordcloud
+        self._fig: Optional['Figure'] = None
+        self._canvas: Optional['FigureCanvasAgg'] = None
+        # Comparison grid figure and its three axes, reused across runs
+        self._grid_fig: Optional['Figure'] = None
+        self._grid_axes = None
+    
+    def _load_mask(self, mask_image_path: str) -> np.ndarray:
+        """Load a mask image, downscaled to fit the canvas, reusing unchanged files"""
+        stat = os.stat(mask_image_path)
+        key = (mask_image_path, stat.st_mtime_ns, stat.st_size)
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            # WordCloud only needs a 2D uint8 mask (255 = background)
+            img = Image.open(mask_image_path).convert('L')
+            # Shrink oversized masks, keeping the aspect ratio so the shape is preserved
+            scale = min(self._WIDTH / img.width, self._HEIGHT / img.height)
+            if scale < 1:
+                img = img.resize(
+                    (max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                    Image.NEAREST
+                )
+            mask = np.asarray(img)  # uint8, H x W
+            self._mask_cache[key] = mask
+        return mask
+    
+    def _new_wc(self, colormap: str, mask: Optional[np.ndarray] = None, contour: bool = False,
+                collocations: Optional[bool] = None) -> 'WordCloud':
+        """Create a WordCloud with the generator's shared settings"""
+        contour_kwargs = {'contour_width': 3, 'contour_color': 'steelblue'} if contour else {}
+        return WordCloud(
+            width=self._WIDTH,
+            height=self._HEIGHT,
+            max_words=self._MAX_WORDS,
+            colormap=colormap,
+            background_color='white',
+            mask=mask,
+            relative_scaling=0.5,
+            min_font_size=10,
+            max_font_size=100,
+            collocations=self._COLLOC if collocations is None else collocations,
+            # Frequencies are counted and filtered before layout
+            stopwords=set(),
+            **contour_kwargs
+        )
         
     def create_keyword_wordcloud(self, keywords: List[Dict[str, Any]], 
                                title: str = "Keywords Word Cloud",
                                save_path: Optional[str] = None,
                                colormap: str = 'viridis') -> Optional['WordCloud']:
-        """Create word cloud from keywords with scores"""
+        """Create word cloud from keywords with scores (keywords are single terms, no collocations)"""
         if not WORDCLOUD_AVAILABLE:
             logger.error("WordCloud library not available")
             return None
@@ -40,27 +203,18 @@ class WordCloudGenerator:
             return None
         
         try:
-            # Prepare word frequencies from keywords
-            word_frequencies = {}
-            for keyword in keywords:
-                word = keyword['keyword']
-                # Use score as weight, fallback to frequency
-                weight = keyword.get('score', keyword.get('frequency', 1))
-                word_frequencies[word] = weight
+            # Prepare word frequencies from the top keywords
+            word_frequencies = _top_frequencies(
+                ((_weight(keyword), keyword['keyword'])
+                 for keyword in keywords),
+                self._MAX_WORDS
+            )
             
             # Create word cloud
-            wordcloud = WordCloud(
-                width=self.width,
-                height=self.height,
-                max_words=self.max_words,
-                colormap=colormap,
-                background_color='white',
-                relative_scaling=0.5,
-                min_font_size=10,
-                max_font_size=100,
-                collocations=self.collocations,
-                stopwords=set()  # We already filtered keywords
-            ).generate_from_frequencies(word_frequencies)
+            # We already filtered keywords, so no stopwords
+            wordcloud = self._new_wc(colormap, collocations=False).generate_from_frequencies(
+                word_frequencies
+            )
             
             # Create visualization
             self._visualize_wordcloud(wordcloud, title, save_path)
@@ -72,55 +226,39 @@ class WordCloudGenerator:
             logger.error(f"Error creating keyword word cloud: {e}")
             return None
     
-    def create_text_wordcloud(self, texts: List[str], 
+    def create_text_wordcloud(self, texts: Iterable[str], 
                             title: str = "Text Word Cloud",
                             save_path: Optional[str] = None,
                             colormap: str = 'plasma',
                             additional_stopwords: Optional[set] = None) -> Optional['WordCloud']:
-        """Create word cloud from raw text data"""
+        """Create word cloud from raw text data (any iterable, consumed once)"""
         if not WORDCLOUD_AVAILABLE:
             logger.error("WordCloud library not available")
             return None
         
-        if not texts:
-            logger.warning("No texts provided for word cloud")
-            return None
-        
         try:
-            # Combine all texts
-            combined_text = ' '.join(texts)
-            
-            # Prepare stopwords
-            stopwords = set(STOPWORDS)
-            if additional_stopwords:
-                stopwords.update(additional_stopwords)
-            
-            # Add language-specific stopwords
-            if hasattr(self, 'language'):
-                from ..nlp.text_preprocessor import TextPreprocessor
-                preprocessor = TextPreprocessor(self.language)
-                if hasattr(preprocessor, 'stop_words'):
-                    for lang_stopwords in preprocessor.stop_words.values():
-                        stopwords.update(lang_stopwords)
+            extra = frozenset(additional_stopwords) if additional_stopwords else frozenset()
+            stopwords = _resolve_stopwords(getattr(self, 'language', None), extra)
             
-            # Create word cloud
-            wordcloud = WordCloud(
-                width=self.width,
-                height=self.height,
-                max_words=self.max_words,
-                colormap=colormap,
-                background_color='white',
-                relative_scaling=0.5,
-                min_font_size=10,
-                max_font_size=100,
-                collocations=self.collocations,
-                stopwords=stopwords
-            ).generate(combined_text)
+            # Stream texts into the counter; no joined copy of the corpus is built
+            counts = Counter()
+            text_count = 0
+            for text_count, text in enumerate(texts, 1):
+                counts.update(_tokens(text, stopwords))
+            
+            if not text_count:
+                logger.warning("No texts provided for word cloud")
+                return None
+            
+            # Create word cloud from the top words only
+            wordcloud = self._new_wc(colormap).generate_from_frequencies(
+                _word_frequencies(counts, self._MAX_WORDS)
+            )
             
             # Create visualization
             self._visualize_wordcloud(wordcloud, title, save_path)
             
-            logger.info(f"Text word cloud created from {len(texts)} texts")
+            logger.info(f"Text word cloud created from {text_count} texts")
             return wordcloud
             
         except Exception as e:
@@ -193,27 +331,18 @@ class WordCloudGenerator:
             return None
         
         try:
-            # Combine all keywords with group prefixes
-            combined_frequencies = {}
-            
-            for group_name, keywords in keywords_groups.items():
-                for keyword in keywords:
-                    word = f"{group_name}:{keyword['keyword']}"
-                    weight = keyword.get('score', keyword.get('frequency', 1))
-                    combined_frequencies[word] = weight
+            # Combine the top keywords across groups with group prefixes
+            combined_frequencies = _top_frequencies(
+                ((_weight(keyword), f"{group_name}:{keyword['keyword']}")
+                 for group_name, keywords in keywords_groups.items()
+                 for keyword in keywords),
+                self._MAX_WORDS
+            )
             
             # Create word cloud
-            wordcloud = WordCloud(
-                width=self.width,
-                height=self.height,
-                max_words=self.max_words,
-                colormap='tab10',
-                background_color='white',
-                relative_scaling=0.5,
-                min_font_size=10,
-                max_font_size=100,
-                collocations=False
-            ).generate_from_frequencies(combined_frequencies)
+            wordcloud = self._new_wc('tab10', collocations=False).generate_from_frequencies(
+                combined_frequencies
+            )
             
             # Create visualization
             self._visualize_wordcloud(wordcloud, title, save_path)
@@ -230,7 +359,7 @@ class WordCloudGenerator:
                                     title: str = "Custom Shape Word Cloud",
                                     save_path: Optional[str] = None,
                                     colormap: str = 'viridis') -> Optional['WordCloud']:
-        """Create word cloud in custom shape"""
+        """Create word cloud in custom shape (keywords are single terms, no collocations)"""
         if not WORDCLOUD_AVAILABLE:
             logger.error("WordCloud library not available")
             return None
@@ -241,29 +370,18 @@ class WordCloudGenerator:
         
         try:
             # Load mask image
-            mask = np.array(Image.open(mask_image_path))
+            mask = self._load_mask(mask_image_path)
             
-            # Prepare word frequencies
-            word_frequencies = {}
-            for keyword in keywords:
-                word = keyword['keyword']
-                weight = keyword.get('score', keyword.get('frequency', 1))
-                word_frequencies[word] = weight
+            # Prepare word frequencies from the top keywords
+            word_frequencies = _top_frequencies(
+                ((_weight(keyword), keyword['keyword'])
+                 for keyword in keywords),
+                self._MAX_WORDS
+            )
             
             # Create word cloud with mask
-            wordcloud = WordCloud(
-                width=self.width,
-                height=self.height,
-                max_words=self.max_words,
-                colormap=colormap,
-                background_color='white',
-                mask=mask,
-                relative_scaling=0.5,
-                min_font_size=10,
-                max_font_size=100,
-                collocations=self.collocations,
-                contour_width=3,
-                contour_color='steelblue'
+            wordcloud = self._new_wc(
+                colormap, mask=mask, contour=True, collocations=False
             ).generate_from_frequencies(word_frequencies)
             
             # Create visualization
@@ -276,76 +394,134 @@ class WordCloudGenerator:
             logger.error(f"Error creating custom shape word cloud: {e}")
             return None
     
-    def _visualize_wordcloud(self, wordcloud: 'WordCloud', title: str, save_path: Optional[str]):
-        """Visualize word cloud"""
+    def _visualize_wordcloud(self, wordcloud: 'WordCloud', title: Optional[str],
+                             save_path: Optional[str]):
+        """Render word cloud with its title to save_path (raw image when untitled)"""
+        if not save_path:
+            return
+        
         try:
-            plt.figure(figsize=(12, 8))
-            plt.imshow(wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.title(title, fontsize=16, fontweight='bold', pad=20)
-            
-            if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            # Without a title there is nothing for matplotlib to add; write the image directly
+            if not title:
+                wordcloud.to_file(save_path)
                 logger.info(f"Word cloud saved to {save_path}")
-            else:
-                plt.show()
-                
+                return
+            
+            if not MATPLOTLIB_AVAILABLE:
+                logger.error("Matplotlib not available")
+                return
+            
+            # Reuse one pyplot-free figure instead of opening a new one per call
+            if self._fig is None:
+                self._fig = Figure(figsize=(12, 8))
+                self._canvas = FigureCanvasAgg(self._fig)
+            self._fig.clear()
+            
+            ax = self._fig.add_subplot(111)
+            ax.imshow(wordcloud, interpolation='bilinear')
+            ax.axis('off')
+            ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
+            
+            self._fig.savefig(save_path, **_SAVEFIG_KWARGS)
+            logger.info(f"Word cloud saved to {save_path}")
+            
         except Exception as e:
             logger.error(f"Error visualizing word cloud: {e}")
     
+    def _gen_freq_cloud(self, frequencies: Dict[str, float], colormap: str) -> Optional['WordCloud']:
+        """Lay out a word cloud from frequencies, or None when there are none"""
+        if not frequencies:
+            return None
+        return self._new_wc(colormap).generate_from_frequencies(frequencies)
+    
+    def _render_to_ax(self, wordcloud: Optional['WordCloud'], ax, title: str):
+        """Draw a laid-out word cloud (or a no-data note) on an existing axis"""
+        if wordcloud is not None:
+            ax.imshow(wordcloud, interpolation='bilinear')
+        else:
+            ax.text(0.5, 0.5, 'No Data', ha='center', va='center', transform=ax.transAxes)
+        ax.set_title(title, fontsize=12, fontweight='bold')
+        ax.axis('off')
+    
+    def _iter_sentiment_clouds(self, sentiment_results: List[Dict[str, Any]]
+                               ) -> Iterator[Optional['WordCloud']]:
+        """Lay out one word cloud per sentiment panel, yielded in panel order"""
+        # Group texts once, then tokenize each text a single time
+        by_sent = _group_texts_by_sentiment(sentiment_results)
+        stopwords = _resolve_stopwords(getattr(self, 'language', None), frozenset())
+        
+        freqs = []
+        for sentiment, _, _ in self._SENTIMENT_PANELS:
+            counts = Counter()
+            for text in by_sent[sentiment]:
+                counts.update(_tokens(text, stopwords))
+            freqs.append(_word_frequencies(counts, self._MAX_WORDS))
+        
+        # Lay out the next panel in the background while the caller draws the current one
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._gen_freq_cloud, frequencies, colormap)
+                for frequencies, (_, colormap, _) in zip(freqs, self._SENTIMENT_PANELS)
+            ]
+            for future in futures:
+                yield future.result()
+    
+    def _prepare_grid(self, title: str):
+        """Get the 1x3 comparison grid figure, created once and cleared on later runs"""
+        if self._grid_fig is None:
+            self._grid_fig = Figure(figsize=(18, 6))
+            FigureCanvasAgg(self._grid_fig)
+            self._grid_axes = self._grid_fig.subplots(1, 3)
+        else:
+            for ax in self._grid_axes:
+                ax.clear()
+        self._grid_fig.suptitle(title, fontsize=16, fontweight='bold')
+        return self._grid_fig, self._grid_axes
+    
     def create_wordcloud_comparison_grid(self, sentiment_results: List[Dict[str, Any]],
                                        title: str = "Sentiment Word Clouds Comparison",
                                        save_path: Optional[str] = None) -> bool:
         """Create grid of word clouds for different sentiments"""
+        return self._render_sentiment_grid(sentiment_results, title, save_path)
+    
+    def _render_sentiment_grid(self, sentiment_results: List[Dict[str, Any]],
+                               title: str = "Sentiment Word Clouds Comparison",
+                               save_path: Optional[str] = None,
+                               individual_dir: Optional[str] = None) -> bool:
+        """Lay out each sentiment cloud once for the grid, also saving it alone under individual_dir"""
         if not WORDCLOUD_AVAILABLE:
             logger.error("WordCloud library not available")
             return False
         
+        if not MATPLOTLIB_AVAILABLE:
+            logger.error("Matplotlib not available")
+            return False
+        
         try:
-            # Create figure with subplots
-            fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-            fig.suptitle(title, fontsize=16, fontweight='bold')
-            
-            sentiments = ['positive', 'negative', 'neutral']
-            colormaps = ['Greens', 'Reds', 'Grays']
-            titles = ['Positive Sentiment', 'Negative Sentiment', 'Neutral Sentiment']
-            
-            for i, (sentiment, colormap, subtitle) in enumerate(zip(sentiments, colormaps, titles)):
-                # Filter texts for this sentiment
-                sentiment_texts = [
-                    r.get('text', '') for r in sentiment_results 
-                    if r['sentiment'] == sentiment and r.get('text', '') and r.get('text', '') != '...'
-                ]
+            fig, axes = self._prepare_grid(title)
+            
+            clouds = self._iter_sentiment_clouds(sentiment_results)
+            for ax, (sentiment, _, subtitle), wordcloud in zip(axes, self._SENTIMENT_PANELS, clouds):
+                self._render_to_ax(wordcloud, ax, subtitle)
+                
+                if individual_dir is None:
+                    continue
                 
-                if sentiment_texts:
-                    # Create word cloud
-                    wordcloud = self.create_text_wordcloud(
-                        texts=sentiment_texts,
-                        title=subtitle,
-                        colormap=colormap
+                # Individual sentiment word cloud, same output as create_sentiment_wordcloud
+                if wordcloud is not None:
+                    self._visualize_wordcloud(
+                        wordcloud,
+                        f"{sentiment.capitalize()} Sentiment Word Cloud",
+                        os.path.join(individual_dir, f'{sentiment}_sentiment_wordcloud.png')
                     )
-                    
-                    if wordcloud:
-                        axes[i].imshow(wordcloud, interpolation='bilinear')
-                        axes[i].set_title(subtitle, fontsize=12, fontweight='bold')
-                    else:
-                        axes[i].text(0.5, 0.5, 'No Data', ha='center', va='center', 
-                                   transform=axes[i].transAxes)
-                        axes[i].set_title(subtitle, fontsize=12, fontweight='bold')
                 else:
-                    axes[i].text(0.5, 0.5, 'No Data', ha='center', va='center', 
-                               transform=axes[i].transAxes)
-                    axes[i].set_title(subtitle, fontsize=12, fontweight='bold')
-                
-                axes[i].axis('off')
+                    logger.warning(f"No texts found for sentiment: {sentiment}")
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
+                fig.savefig(save_path, **_SAVEFIG_KWARGS)
                 logger.info(f"Word cloud comparison grid saved to {save_path}")
-            else:
-                plt.show()
             
             return True
             
@@ -356,42 +532,95 @@ class WordCloudGenerator:
     def generate_all_wordclouds(self, analysis_results: Dict[str, Any], output_dir: str):
         """Generate all types of word clouds"""
         try:
-            import os
-            
             # Create output directory if it doesn't exist
             os.makedirs(output_dir, exist_ok=True)
             
+            # Independent render tasks: (method, analysis_results key, kwargs, file name or None)
+            tasks = []
+            
             # Keyword word cloud
             if 'keywords' in analysis_results:
-                self.create_keyword_wordcloud(
-                    keywords=analysis_results['keywords'],
-                    save_path=os.path.join(output_dir, 'keywords_wordcloud.png')
-                )
+                tasks.append(('create_keyword_wordcloud', 'keywords', {}, 'keywords_wordcloud.png'))
             
-            # Sentiment word clouds
+            # Individual sentiment word clouds and comparison grid, sharing one layout each
             if 'sentiment_results' in analysis_results:
-                # Individual sentiment word clouds
-                for sentiment in ['positive', 'negative', 'neutral']:
-                    self.create_sentiment_wordcloud(
-                        sentiment_results=analysis_results['sentiment_results'],
-                        sentiment_type=sentiment,
-                        save_path=os.path.join(output_dir, f'{sentiment}_sentiment_wordcloud.png')
-                    )
-                
-                # Comparison grid
-                self.create_wordcloud_comparison_grid(
-                    sentiment_results=analysis_results['sentiment_results'],
-                    save_path=os.path.join(output_dir, 'sentiment_wordclouds_comparison.png')
-                )
+                tasks.append((
+                    '_render_sentiment_grid', 'sentiment_results', {'individual_dir': output_dir},
+                    'sentiment_wordclouds_comparison.png'
+                ))
             
             # Text word cloud (if raw texts available)
             if 'raw_texts' in analysis_results:
-                self.create_text_wordcloud(
-                    texts=analysis_results['raw_texts'],
-                    save_path=os.path.join(output_dir, 'text_wordcloud.png')
-                )
+                tasks.append(('create_text_wordcloud', 'raw_texts', {}, 'text_wordcloud.png'))
+            
+            self._run_render_tasks(tasks, analysis_results, output_dir)
             
             logger.info(f"All word clouds generated in {output_dir}")
             
         except Exception as e:
-            logger.error(f"Error generating word clouds: {e}")
\ No newline at end of file
+            logger.error(f"Error generating word clouds: {e}")
+    
+    def _run_render_tasks(self, tasks: List[tuple], analysis_results: Dict[str, Any],
+                          output_dir: str):
+        """Run render tasks in worker processes, redoing only failed ones in this process"""
+        # A single worker only adds process start-up and import cost
+        if len(tasks) > 1 and (os.cpu_count() or 1) >= 2:
+            pending = tasks
+            try:
+                mp_context, log_queue, level = get_worker_logging()
+                # Workers only receive the inputs their tasks read
+                task_inputs = {data_key: analysis_results[data_key] for _, data_key, _, _ in tasks}
+                with ProcessPoolExecutor(
+                    max_workers=min(4, os.cpu_count()),
+                    mp_context=mp_context,
+                    initializer=_init_render_worker,
+                    initargs=(task_inputs, getattr(self, 'language', None), log_queue, level)
+                ) as executor:
+                    futures = []
+                    for task in tasks:
+                        method, data_key, kwargs, file_name = task
+                        out_path = os.path.join(output_dir, file_name) if file_name else None
+                        futures.append((task, executor.submit(
+                            _render_task, method, data_key, kwargs, out_path
+                        )))
+                    pending = []
+                    for task, future in futures:
+                        try:
+                            future.result()
+                        except Exception as e:
+                            logger.warning(f"Word cloud task {task[0]} failed in worker: {e}")
+                            pending.append(task)
+            except Exception as e:
+                logger.warning(f"Parallel word cloud rendering failed, rendering serially: {e}")
+            tasks = pending
+        
+        for method, data_key, kwargs, file_name in tasks:
+            if file_name:
+                kwargs = dict(kwargs, save_path=os.path.join(output_dir, file_name))
+            getattr(self, method)(analysis_results[data_key], **kwargs)
+
+# Per-process state for generate_all_wordclouds workers
+_WORKER_GENERATOR: Optional[WordCloudGenerator] = None
+_WORKER_RESULTS: Dict[str, Any] = {}
+
+def _init_render_worker(task_inputs: Dict[str, Any], language: Optional[str], log_queue,
+                        level: int):
+    """Prepare a worker process: parent-bound logging, GUI-free backend, language and task inputs"""
+    global _WORKER_GENERATOR, _WORKER_RESULTS
+    init_worker_logging(log_queue, level)
+    import matplotlib
+    matplotlib.use('Agg')
+    
+    _WORKER_GENERATOR = WordCloudGenerator()
+    # Same stopwords as the parent generator
+    if language is not None:
+        _WORKER_GENERATOR.language = language
+    _WORKER_RESULTS = task_inputs
+
+def _render_task(method: str, data_key: str, payload: Dict[str, Any],
+                 out_path: Optional[str]) -> bool:
+    """Render word clouds in a worker process, saving to out_path when the task has one"""
+    if out_path is not None:
+        payload = dict(payload, save_path=out_path)
+    result = getattr(_WORKER_GENERATOR, method)(_WORKER_RESULTS[data_key], **payload)
+    return bool(result)
\ No newline at end of file